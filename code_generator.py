@@ -9,127 +9,268 @@ Features include:
 """
 
 import os
-import json
+import sys
+import time
 import argparse
+from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
-from string import Template
-from typing import Dict, Any, List
+from string import Formatter, Template
+from typing import Callable, Dict, Any, Iterator, List, Optional, Set, Tuple, Union
 import re
 
 
-class TemplateEngine:
+# Matches the position before each interior capital letter in a CamelCase name
+_CAMEL_RE = re.compile(r'(?<!^)(?=[A-Z])')
+
+
+def _as_path(path: Union[str, Path]) -> Path:
     """
-    A simple template engine for code generation.
+    Return path as a Path, reusing it if it already is one.
     """
-    
-    def __init__(self, templates_dir: str = None):
-        self.templates_dir = Path(templates_dir) if templates_dir else Path(__file__).parent / "templates"
-        self.templates_dir.mkdir(exist_ok=True)
-        
-        # Create default templates if they don't exist
-        self._create_default_templates()
-    
-    def _create_default_templates(self):
-        """
-        Create default templates for common use cases.
-        """
-        # Python package template
-        python_pkg_template = '''"""
-$package_name package
+    return path if isinstance(path, Path) else Path(path)
+
 
-Created on $date
+def _template_key(template_name: str) -> str:
+    """
+    Normalize a template name, adding the .py extension if it has none.
+    """
+    name = Path(template_name)
+    if not name.suffix:
+        name = name.with_suffix('.py')
+    return name.as_posix()
+
+
+def _to_snake(name: str) -> str:
+    """
+    Convert a CamelCase name to snake_case.
+    """
+    return _CAMEL_RE.sub('_', name).lower()
+
+
+# Default value for the date template variable, refreshed once per day
+_TODAY: Optional[str] = None
+# time.time() value at the next local midnight, when _TODAY goes stale
+_TODAY_EXPIRES = 0.0
+
+
+def _today() -> str:
+    """
+    Return today's date as YYYY-MM-DD, computed once per calendar day.
+    """
+    global _TODAY, _TODAY_EXPIRES
+    if _TODAY is None or time.time() >= _TODAY_EXPIRES:
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        _TODAY = now.strftime("%Y-%m-%d")
+        _TODAY_EXPIRES = midnight.timestamp()
+    return _TODAY
+
+
+# Default templates written to a new templates directory
+_DEFAULT_TEMPLATES: Dict[str, bytes] = {
+    # Python package template
+    "python/package.py": b'''"""
+{package_name} package
+
+Created on {date}
 """
 
 __version__ = "0.1.0"
-__author__ = "$author"
+__author__ = "{author}"
 
 def main():
     """
-    Main function for $package_name
+    Main function for {package_name}
     """
-    print("$package_name version {__version__}")
+    print("{package_name} version {{__version__}}")
 
 
 if __name__ == "__main__":
     main()
-'''
-        
-        # Python class template
-        python_class_template = '''"""
-$module_name module
+''',
+    
+    # Python class template
+    "python/class.py": b'''"""
+{module_name} module
 
-Created on $date
+Created on {date}
 """
 
-class $class_name:
+class {class_name}:
     """
-    A class representing $class_name
+    A class representing {class_name}
     """
     
-    def __init__(self$constructor_params):
+    def __init__(self{constructor_params}):
         """
-        Initialize the $class_name instance.
+        Initialize the {class_name} instance.
         """
-$constructor_body
+{constructor_body}
 
     def __str__(self):
         """
-        String representation of the $class_name instance.
+        String representation of the {class_name} instance.
         """
-        return f"$class_name()"
+        return f"{class_name}()"
 
     def __repr__(self):
         """
-        Developer-friendly representation of the $class_name instance.
+        Developer-friendly representation of the {class_name} instance.
         """
-        return f"$class_name()"
-'''
-        
-        # Python test template
-        python_test_template = '''"""
-Tests for $module_name
+        return f"{class_name}()"
+''',
+    
+    # Python test template
+    "python/test.py": b'''"""
+Tests for {module_name}
 """
 
 import pytest
-from $module_name import $class_name
+from {module_name} import {class_name}
 
 
-class Test$class_name:
+class Test{class_name}:
     """
-    Test cases for $class_name class
+    Test cases for {class_name} class
     """
     
     def test_initialization(self):
         """
-        Test initialization of $class_name
+        Test initialization of {class_name}
         """
-        obj = $class_name()
+        obj = {class_name}()
         assert obj is not None
 
     def test_string_representation(self):
         """
-        Test string representation of $class_name
+        Test string representation of {class_name}
         """
-        obj = $class_name()
+        obj = {class_name}()
         assert isinstance(str(obj), str)
-'''
-        
-        # Create templates directory if needed
-        (self.templates_dir / "python").mkdir(exist_ok=True)
+''',
+}
+
+
+# Decoded default templates, shared so repeated loads return the same string
+_DEFAULT_TEXT: Dict[str, str] = {
+    name: content.decode('utf-8') for name, content in _DEFAULT_TEMPLATES.items()
+}
+
+
+def _split_placeholders(content: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Split a {name}-style template into (literal text, variable name) pairs.
+    
+    Escaped braces are already unescaped in the literal text. The variable
+    name is None for trailing text after the last placeholder.
+    """
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in Formatter().parse(content)
+    )
+
+
+def _render_segments(segments: Tuple[Tuple[str, Optional[str]], ...], variables: Dict[str, Any]) -> str:
+    """
+    Render a template split by _split_placeholders in a single pass.
+    
+    Values are inserted as-is and never scanned for placeholders.
+    
+    Raises:
+        KeyError: If a required variable is missing
+    """
+    parts = []
+    for literal, key in segments:
+        parts.append(literal)
+        if key is not None:
+            parts.append(str(variables[key]))
+    return ''.join(parts)
+
+
+def _uses_dollar_placeholders(content: str) -> bool:
+    """
+    Check whether a template uses string.Template style $placeholders.
+    
+    Default templates written by earlier versions use this style and are
+    still rendered with string.Template.
+    """
+    return any(
+        match.group('named') or match.group('braced')
+        for match in Template.pattern.finditer(content)
+    )
+
+
+def _iter_python_files(root: str) -> Iterator[str]:
+    """
+    Yield the paths of all .py files below root, depth first.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_python_files(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry.path
+
+
+class TemplateEngine:
+    """
+    A simple template engine for code generation.
+    """
+    
+    # Marker written once the default templates have been created
+    DEFAULTS_MARKER = ".defaults_v1"
+    
+    # Template directories whose defaults are known to exist in this process
+    _defaults_initialized: Set[Path] = set()
+    
+    def __init__(self, templates_dir: str = None, create_defaults: bool = True):
+        self.templates_dir = Path(templates_dir) if templates_dir else Path(__file__).parent / "templates"
         
-        # Write default templates
-        templates = {
-            "python/package.py": python_pkg_template,
-            "python/class.py": python_class_template,
-            "python/test.py": python_test_template
-        }
+        # Loaded template content keyed by path, invalidated on mtime change
+        self._template_cache: Dict[Path, Tuple[float, str]] = {}
+        # Template source and the function that renders it, keyed by template name
+        self._compiled: Dict[str, Tuple[str, Callable[[Dict[str, Any]], str]]] = {}
+        # Output directories already created by this engine
+        self._ensured_dirs: Set[Path] = set()
         
-        for template_path, content in templates.items():
+        # Create default templates if they don't exist
+        self._create_defaults = create_defaults
+        if create_defaults:
+            self._ensure_default_templates()
+    
+    def _ensure_default_templates(self):
+        """
+        Create the default templates once per templates directory.
+        """
+        # Resolve so a relative directory isn't mistaken for another one after chdir
+        resolved_dir = self.templates_dir.resolve()
+        if resolved_dir in TemplateEngine._defaults_initialized:
+            return
+        
+        marker = self.templates_dir / self.DEFAULTS_MARKER
+        if not marker.exists():
+            try:
+                self.templates_dir.mkdir(exist_ok=True)
+                self._create_default_templates()
+                marker.touch()
+            except OSError:
+                # Not writable (e.g. a read-only install): serve the bundled
+                # defaults from memory instead
+                self._create_defaults = False
+                return
+        
+        TemplateEngine._defaults_initialized.add(resolved_dir)
+    
+    def _create_default_templates(self):
+        """
+        Create default templates for common use cases.
+        """
+        for template_path, content in _DEFAULT_TEMPLATES.items():
             full_path = self.templates_dir / template_path
             full_path.parent.mkdir(parents=True, exist_ok=True)
             if not full_path.exists():
-                with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                full_path.write_bytes(content)
     
     def load_template(self, template_name: str) -> str:
         """
@@ -141,17 +282,32 @@ class Test$class_name:
         Returns:
             Template content as a string
         """
-        template_path = self.templates_dir / template_name
-        
-        # If template doesn't have an extension, try adding .py
-        if not template_path.suffix:
-            template_path = template_path.with_suffix('.py')
-        
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template {template_path} does not exist")
-        
-        with open(template_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        name = _template_key(template_name)
+        template_path = self.templates_dir / name
+        
+        try:
+            mtime = template_path.stat().st_mtime
+        except FileNotFoundError:
+            if name not in _DEFAULT_TEMPLATES:
+                raise FileNotFoundError(f"Template {template_path} does not exist") from None
+            if not self._create_defaults:
+                return _DEFAULT_TEXT[name]
+            
+            # Restore a default template deleted after the defaults were created
+            try:
+                template_path.parent.mkdir(parents=True, exist_ok=True)
+                template_path.write_bytes(_DEFAULT_TEMPLATES[name])
+            except OSError:
+                return _DEFAULT_TEXT[name]
+            mtime = template_path.stat().st_mtime
+        
+        cached = self._template_cache.get(template_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        content = template_path.read_text(encoding='utf-8')
+        self._template_cache[template_path] = (mtime, content)
+        return content
     
     def generate_from_template(self, template_name: str, variables: Dict[str, Any]) -> str:
         """
@@ -164,17 +320,45 @@ class Test$class_name:
         Returns:
             Generated code as a string
         """
-        template_content = self.load_template(template_name)
-        template = Template(template_content)
+        name = _template_key(template_name)
+        template_content = self.load_template(name)
+        compiled = self._compiled.get(name)
+        # Rebuild only if load_template picked up new content from disk
+        if compiled is None or compiled[0] is not template_content:
+            compiled = (template_content, self._make_renderer(name, template_content))
+            self._compiled[name] = compiled
         
         # Add default variables if not provided
         if 'date' not in variables:
-            from datetime import datetime
-            variables['date'] = datetime.now().strftime("%Y-%m-%d")
+            variables = {**variables, 'date': _today()}
         
-        return template.substitute(variables)
+        return compiled[1](variables)
     
-    def create_from_template(self, template_name: str, output_path: str, variables: Dict[str, Any]) -> None:
+    def _make_renderer(self, name: str, content: str) -> Callable[[Dict[str, Any]], str]:
+        """
+        Choose how a template's content will be rendered.
+        
+        Args:
+            name: Normalized template name (see _template_key)
+            content: Template content
+            
+        Returns:
+            Function taking the template variables and returning generated code
+        """
+        # Only the bundled defaults use {name} placeholders. Every other
+        # template, including one without any placeholders, is a
+        # string.Template.
+        if name not in _DEFAULT_TEMPLATES or _uses_dollar_placeholders(content):
+            return Template(content).substitute
+        
+        # Unmodified defaults only contain plain {name} placeholders, so they
+        # can be split once and joined on every render
+        if content == _DEFAULT_TEXT[name]:
+            return partial(_render_segments, _split_placeholders(content))
+        
+        return content.format_map
+    
+    def create_from_template(self, template_name: str, output_path: Union[str, Path], variables: Dict[str, Any]) -> None:
         """
         Create a file from a template with provided variables.
         
@@ -184,24 +368,44 @@ class Test$class_name:
             variables: Dictionary of variables to substitute in the template
         """
         generated_code = self.generate_from_template(template_name, variables)
+        self.write(output_path, generated_code)
+    
+    def write(self, output_path: Union[str, Path], content: str) -> None:
+        """
+        Write generated content to a file, creating parent directories as needed.
         
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(generated_code)
+        Args:
+            output_path: Path where the content should be saved
+            content: Content to write
+        """
+        output_path = _as_path(output_path)
+        data = content.encode('utf-8')
+        parent = output_path.parent
+        if parent not in self._ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent)
+        try:
+            output_path.write_bytes(data)
+        except FileNotFoundError:
+            # The directory was removed after an earlier write; create it again
+            parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(data)
 
 
 class CodeGenerator:
     """
     Main class for code generation from templates.
+    
+    A CodeGenerator only holds caches (template content, rendered templates,
+    created directories), not per-request state, so one instance can be
+    shared across any number of calls.
     """
     
-    def __init__(self, templates_dir: str = None):
-        self.template_engine = TemplateEngine(templates_dir)
+    def __init__(self, templates_dir: str = None, create_defaults: bool = True):
+        self.template_engine = TemplateEngine(templates_dir, create_defaults)
     
     def create_python_package(self, package_name: str, author: str = "Developer", 
-                             output_dir: str = ".") -> None:
+                             output_dir: Union[str, Path] = ".") -> None:
         """
         Create a basic Python package structure.
         
@@ -210,37 +414,33 @@ class CodeGenerator:
             author: Author name
             output_dir: Directory where the package should be created
         """
-        output_path = Path(output_dir) / package_name
+        output_path = _as_path(output_dir) / package_name
         output_path.mkdir(exist_ok=True)
         
-        # Create __init__.py
-        init_path = output_path / "__init__.py"
         variables = {
             "package_name": package_name,
             "author": author
         }
-        self.template_engine.create_from_template(
-            "python/package.py", 
-            init_path, 
+        # __init__.py and main.py share the same content, so render it once
+        package_code = self.template_engine.generate_from_template(
+            "python/package.py",
             variables
         )
         
+        write = self.template_engine.write
+        
+        # Create __init__.py
+        init_path = output_path / "__init__.py"
+        write(init_path, package_code)
+        
         # Create main module
         main_path = output_path / "main.py"
-        variables = {
-            "package_name": package_name,
-            "author": author
-        }
-        self.template_engine.create_from_template(
-            "python/package.py", 
-            main_path, 
-            variables
-        )
+        write(main_path, package_code)
         
         print(f"Python package '{package_name}' created at {output_path}")
     
     def create_python_class(self, class_name: str, module_name: str = None, 
-                           output_dir: str = ".", **kwargs) -> None:
+                           output_dir: Union[str, Path] = ".", **kwargs) -> None:
         """
         Create a Python class file from template.
         
@@ -252,9 +452,9 @@ class CodeGenerator:
         """
         # Convert class name to snake_case for module name if not provided
         if module_name is None:
-            module_name = re.sub(r'(?<!^)(?=[A-Z])', '_', class_name).lower()
+            module_name = _to_snake(class_name)
         
-        output_path = Path(output_dir) / f"{module_name}.py"
+        output_path = _as_path(output_dir) / f"{module_name}.py"
         
         # Prepare constructor parameters and body
         constructor_params = kwargs.get('constructor_params', '')
@@ -276,7 +476,7 @@ class CodeGenerator:
         print(f"Python class '{class_name}' created at {output_path}")
     
     def create_test_file(self, class_name: str, module_name: str = None, 
-                        output_dir: str = ".") -> None:
+                        output_dir: Union[str, Path] = ".") -> None:
         """
         Create a test file for a Python class.
         
@@ -287,11 +487,11 @@ class CodeGenerator:
         """
         # Convert class name to snake_case for module name if not provided
         if module_name is None:
-            module_name = re.sub(r'(?<!^)(?=[A-Z])', '_', class_name).lower()
+            module_name = _to_snake(class_name)
         
         # Create test file name
         test_filename = f"test_{module_name}.py"
-        output_path = Path(output_dir) / test_filename
+        output_path = _as_path(output_dir) / test_filename
         
         variables = {
             "class_name": class_name,
@@ -313,65 +513,85 @@ class CodeGenerator:
         Returns:
             List of template names
         """
-        templates = []
-        for root, dirs, files in os.walk(self.template_engine.templates_dir):
-            for file in files:
-                if file.endswith('.py'):
-                    rel_path = Path(root).relative_to(self.template_engine.templates_dir)
-                    template_name = str(rel_path / file)
-                    if template_name.startswith('.'):
-                        template_name = template_name[2:]  # Remove './'
-                    templates.append(template_name)
+        base = str(self.template_engine.templates_dir)
+        prefix_len = len(base) + 1
+        try:
+            templates = [path[prefix_len:].replace(os.sep, '/') for path in _iter_python_files(base)]
+        except FileNotFoundError:
+            # The templates directory hasn't been created yet
+            templates = []
+        
+        # Defaults are always available: load_template restores missing ones
+        found = set(templates)
+        templates.extend(name for name in _DEFAULT_TEMPLATES if name not in found)
         return templates
 
 
-def main():
+@lru_cache(maxsize=8)
+def _get_generator(templates_dir: str = None, create_defaults: bool = True) -> CodeGenerator:
+    """
+    Return a shared CodeGenerator for the given templates directory.
+    """
+    return CodeGenerator(templates_dir, create_defaults)
+
+
+def cli(argv: List[str] = None) -> None:
     """
-    Main function to demonstrate the CodeGenerator capabilities.
+    Command-line entry point for the code generator.
+    
+    Args:
+        argv: Argument list to parse (defaults to sys.argv[1:])
     """
     parser = argparse.ArgumentParser(description='Code Generation Template Tool')
-    parser.add_argument('command', choices=['list', 'create-package', 'create-class', 'create-test'], 
-                       help='Command to execute')
-    parser.add_argument('--name', required=True, help='Name for the generated code element')
-    parser.add_argument('--module', help='Module name (optional, defaults to name)')
-    parser.add_argument('--author', default='Developer', help='Author name')
-    parser.add_argument('--output', default='.', help='Output directory (default: current directory)')
-    parser.add_argument('--constructor-params', help='Constructor parameters for class')
-    parser.add_argument('--constructor-body', help='Constructor body for class')
+    subparsers = parser.add_subparsers(dest='command', metavar='<command>')
     
-    args = parser.parse_args()
+    subparsers.add_parser('list', help='List all available templates')
     
-    generator = CodeGenerator()
+    package_parser = subparsers.add_parser('create-package', help='Create a Python package with given NAME')
+    package_parser.add_argument('name', metavar='NAME', help='Name of the package')
+    package_parser.add_argument('--author', default='Developer', help='Author name')
+    package_parser.add_argument('--output', type=Path, default=Path('.'), help='Output directory (default: current directory)')
     
-    if args.command == 'list':
-        templates = generator.list_templates()
-        print("Available templates:")
-        for template in templates:
-            print(f"  - {template}")
-    
-    elif args.command == 'create-package':
-        generator.create_python_package(
-            package_name=args.name,
-            author=args.author,
-            output_dir=args.output
-        )
+    class_parser = subparsers.add_parser('create-class', help='Create a Python class with given NAME')
+    class_parser.add_argument('name', metavar='NAME', help='Name of the class')
+    class_parser.add_argument('--module', help='Module name (defaults to NAME in snake_case)')
+    class_parser.add_argument('--output', type=Path, default=Path('.'), help='Output directory (default: current directory)')
+    class_parser.add_argument('--constructor-params', default='', help='Constructor parameters')
+    class_parser.add_argument('--constructor-body', default='        pass', help='Constructor body')
     
-    elif args.command == 'create-class':
-        generator.create_python_class(
-            class_name=args.name,
-            module_name=args.module,
-            output_dir=args.output,
-            constructor_params=args.constructor_params or '',
-            constructor_body=args.constructor_body or '        pass'
-        )
+    test_parser = subparsers.add_parser('create-test', help='Create a test file for class with given NAME')
+    test_parser.add_argument('name', metavar='NAME', help='Name of the class to test')
+    test_parser.add_argument('--module', help='Module name (defaults to NAME in snake_case)')
+    test_parser.add_argument('--output', type=Path, default=Path('.'), help='Output directory (default: current directory)')
     
-    elif args.command == 'create-test':
-        generator.create_test_file(
-            class_name=args.name,
-            module_name=args.module,
-            output_dir=args.output
-        )
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return
+    
+    # Listing only reads the templates directory, so don't write defaults
+    generator = _get_generator(None, create_defaults=args.command != 'list')
+    
+    def list_templates(args):
+        templates = generator.list_templates()
+        lines = ["Available templates:"]
+        lines.extend(f"  - {template}" for template in templates)
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    commands = {
+        'list': list_templates,
+        'create-package': lambda a: generator.create_python_package(a.name, a.author, a.output),
+        'create-class': lambda a: generator.create_python_class(
+            a.name,
+            a.module,
+            a.output,
+            constructor_params=a.constructor_params,
+            constructor_body=a.constructor_body
+        ),
+        'create-test': lambda a: generator.create_test_file(a.name, a.module, a.output),
+    }
+    commands[args.command](args)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    cli()
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Make the repository importable as the code_generation package when it
+hasn't been installed with ``pip install -e .``.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+try:
+    import code_generation  # noqa: F401
+except ImportError:
+    spec = importlib.util.spec_from_file_location(
+        "code_generation",
+        ROOT / "__init__.py",
+        submodule_search_locations=[str(ROOT)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["code_generation"] = module
+    spec.loader.exec_module(module)
@@ -0,0 +1,334 @@
+import os
+import string
+
+import pytest
+
+from code_generation import code_generator
+from code_generation.code_generator import CodeGenerator, TemplateEngine, cli
+
+
+@pytest.fixture(autouse=True)
+def defaults_initialized(monkeypatch):
+    initialized = set()
+    monkeypatch.setattr(TemplateEngine, "_defaults_initialized", initialized)
+    return initialized
+
+
+def test_load_template_is_cached(tmp_path, monkeypatch) -> None:
+    engine = TemplateEngine(str(tmp_path))
+    first = engine.load_template("python/package.py")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("template was read from disk again")
+
+    monkeypatch.setattr("pathlib.Path.read_text", fail)
+    assert engine.load_template("python/package") is first
+
+
+def test_load_template_reloads_on_mtime_change(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path))
+    engine.load_template("python/package.py")
+
+    path = tmp_path / "python" / "package.py"
+    path.write_text("changed", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert engine.load_template("python/package.py") == "changed"
+
+
+def test_load_template_missing(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        engine.load_template("python/missing.py")
+
+
+def test_generate_from_template_reuses_template(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path))
+    variables = {"package_name": "demo", "author": "Ada", "date": "2024-01-01"}
+
+    first = engine.generate_from_template("python/package.py", variables)
+    template = engine._compiled["python/package.py"]
+    second = engine.generate_from_template("python/package.py", variables)
+
+    assert first == second
+    assert "demo package" in first
+    assert engine._compiled["python/package.py"] is template
+
+
+def test_cli_create_class(tmp_path, monkeypatch, capsys) -> None:
+    templates_dir = str(tmp_path / "templates")
+    monkeypatch.setattr(
+        code_generator,
+        "_get_generator",
+        lambda _, create_defaults: CodeGenerator(templates_dir, create_defaults),
+    )
+    cli(["create-class", "MyWidget", "--output", str(tmp_path), "--constructor-params", ", size"])
+
+    generated = (tmp_path / "my_widget.py").read_text(encoding="utf-8")
+    assert "class MyWidget:" in generated
+    assert "def __init__(self, size):" in generated
+    assert "created at" in capsys.readouterr().out
+
+
+def test_default_templates_written_once(tmp_path, monkeypatch) -> None:
+    TemplateEngine(str(tmp_path))
+    assert (tmp_path / TemplateEngine.DEFAULTS_MARKER).exists()
+
+    def fail(self):
+        raise AssertionError("default templates were recreated")
+
+    monkeypatch.setattr(TemplateEngine, "_create_default_templates", fail)
+    monkeypatch.setattr(TemplateEngine, "_defaults_initialized", set())
+    TemplateEngine(str(tmp_path))
+
+
+def test_create_defaults_disabled(tmp_path) -> None:
+    templates_dir = tmp_path / "templates"
+    TemplateEngine(str(templates_dir), create_defaults=False)
+    assert not templates_dir.exists()
+
+
+def test_list_templates(tmp_path) -> None:
+    generator = CodeGenerator(str(tmp_path))
+    (tmp_path / "top.py").write_text("", encoding="utf-8")
+
+    assert sorted(generator.list_templates()) == [
+        "python/class.py",
+        "python/package.py",
+        "python/test.py",
+        "top.py",
+    ]
+
+
+def test_to_snake() -> None:
+    assert code_generator._to_snake("MyWidgetName") == "my_widget_name"
+    assert code_generator._to_snake("Widget") == "widget"
+
+
+def test_create_python_package(tmp_path) -> None:
+    generator = CodeGenerator(str(tmp_path / "templates"))
+    generator.create_python_package("demo", "Ada", str(tmp_path))
+
+    init_code = (tmp_path / "demo" / "__init__.py").read_text(encoding="utf-8")
+    assert '__author__ = "Ada"' in init_code
+    assert (tmp_path / "demo" / "main.py").read_text(encoding="utf-8") == init_code
+
+
+def test_write_creates_parent_once(tmp_path, monkeypatch) -> None:
+    engine = TemplateEngine(str(tmp_path / "templates"))
+    engine.write(tmp_path / "out" / "a.py", "a")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("parent directory was created again")
+
+    monkeypatch.setattr("pathlib.Path.mkdir", fail)
+    engine.write(tmp_path / "out" / "b.py", "b")
+    assert (tmp_path / "out" / "b.py").read_text(encoding="utf-8") == "b"
+
+
+def test_generate_from_template_adds_date(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path))
+    variables = {"package_name": "demo", "author": "Ada"}
+
+    generated = engine.generate_from_template("python/package.py", variables)
+
+    assert f"Created on {code_generator._today()}" in generated
+    assert "date" not in variables
+
+
+def test_generate_from_dollar_template(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path))
+    (tmp_path / "legacy.py").write_text("class $class_name:\n    data = {}\n", encoding="utf-8")
+
+    generated = engine.generate_from_template("legacy.py", {"class_name": "Widget"})
+
+    assert generated == "class Widget:\n    data = {}\n"
+
+
+def test_user_template_braces_left_alone(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path))
+    content = "data = {}\nX = {'a': 1}\nname = f'{self.name}'\ntext = '{}'.format(1)\n"
+    (tmp_path / "plain.py").write_text(content, encoding="utf-8")
+
+    assert engine.generate_from_template("plain.py", {}) == content
+
+
+def test_generate_package_keeps_version_placeholder(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path))
+    variables = {"package_name": "demo", "author": "Ada", "date": "2024-01-01"}
+
+    generated = engine.generate_from_template("python/package.py", variables)
+
+    assert 'print("demo version {__version__}")' in generated
+
+
+def test_list_templates_missing_directory(tmp_path) -> None:
+    templates_dir = tmp_path / "templates"
+    generator = CodeGenerator(str(templates_dir), create_defaults=False)
+
+    assert sorted(generator.list_templates()) == ["python/class.py", "python/package.py", "python/test.py"]
+    assert not templates_dir.exists()
+
+
+def test_deleted_default_template_is_restored(tmp_path) -> None:
+    generator = CodeGenerator(str(tmp_path / "templates"))
+    class_template = tmp_path / "templates" / "python" / "class.py"
+    class_template.unlink()
+
+    assert "python/class.py" in generator.list_templates()
+    generator.create_python_class("Widget", output_dir=str(tmp_path))
+
+    assert class_template.exists()
+    assert "class Widget:" in (tmp_path / "widget.py").read_text(encoding="utf-8")
+
+
+def test_default_template_requires_known_keys(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path))
+    with pytest.raises(KeyError):
+        engine.generate_from_template("python/test.py", {"class_name": "Widget"})
+
+
+def test_default_template_matches_format_map(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path))
+    variables = {
+        "class_name": "Widget",
+        "module_name": "widget",
+        "date": "2024-01-01",
+        "constructor_params": ", size",
+        "constructor_body": "        self.size = {'default': size}",
+    }
+
+    content = engine.load_template("python/class.py")
+    expected = content.format_map(variables)
+
+    assert engine.generate_from_template("python/class.py", variables) == expected
+
+
+@pytest.fixture
+def get_generator():
+    code_generator._get_generator.cache_clear()
+    yield code_generator._get_generator
+    code_generator._get_generator.cache_clear()
+
+
+def test_get_generator_is_shared(tmp_path, get_generator) -> None:
+    templates_dir = str(tmp_path / "templates")
+    generator = get_generator(templates_dir)
+    assert get_generator(templates_dir) is generator
+
+
+def test_write_recreates_removed_directory(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path / "templates"))
+    out_dir = tmp_path / "out"
+    engine.write(out_dir / "a.py", "a")
+
+    (out_dir / "a.py").unlink()
+    out_dir.rmdir()
+    engine.write(out_dir / "b.py", "b")
+    assert (out_dir / "b.py").read_text(encoding="utf-8") == "b"
+
+
+def test_cli_list(tmp_path, monkeypatch, capsys) -> None:
+    templates_dir = str(tmp_path / "templates")
+    CodeGenerator(templates_dir)
+    monkeypatch.setattr(
+        code_generator,
+        "_get_generator",
+        lambda _, create_defaults: CodeGenerator(templates_dir, create_defaults),
+    )
+    cli(["list"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "Available templates:"
+    assert sorted(lines[1:]) == ["  - python/class.py", "  - python/package.py", "  - python/test.py"]
+
+
+def test_edited_default_template_missing_key(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path))
+    (tmp_path / "python" / "test.py").write_text("# {class_name} {other}\n", encoding="utf-8")
+
+    with pytest.raises(KeyError):
+        engine.generate_from_template("python/test.py", {"class_name": "Widget"})
+
+
+def test_default_template_does_not_rescan_values(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path))
+    variables = {"package_name": "{author}", "author": "Ada", "date": "2024-01-01"}
+
+    generated = engine.generate_from_template("python/package", variables)
+
+    assert generated.startswith('"""\n{author} package')
+    assert generated == engine.load_template("python/package.py").format_map(variables)
+
+
+def test_compiled_keyed_on_normalized_name(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path))
+    variables = {"package_name": "demo", "author": "Ada", "date": "2024-01-01"}
+
+    engine.generate_from_template("python/package", variables)
+    compiled = engine._compiled["python/package.py"]
+    engine.generate_from_template("python/package.py", variables)
+
+    assert list(engine._compiled) == ["python/package.py"]
+    assert engine._compiled["python/package.py"] is compiled
+
+
+def test_missing_default_renderer_is_reused(tmp_path) -> None:
+    engine = TemplateEngine(str(tmp_path / "templates"), create_defaults=False)
+    variables = {"class_name": "Widget", "module_name": "widget", "date": "2024-01-01"}
+
+    engine.generate_from_template("python/test.py", variables)
+    compiled = engine._compiled["python/test.py"]
+    engine.generate_from_template("python/test.py", variables)
+
+    assert engine._compiled["python/test.py"] is compiled
+
+
+def test_defaults_initialized_follows_chdir(tmp_path, monkeypatch) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+
+    monkeypatch.chdir(tmp_path / "a")
+    TemplateEngine("templates")
+    monkeypatch.chdir(tmp_path / "b")
+    TemplateEngine("templates")
+
+    assert (tmp_path / "b" / "templates" / "python" / "class.py").exists()
+
+
+@pytest.mark.parametrize("name", sorted(code_generator._DEFAULT_TEMPLATES))
+def test_default_templates_use_plain_placeholders(name) -> None:
+    fields = [
+        (field_name, spec, conversion)
+        for _, field_name, spec, conversion in string.Formatter().parse(code_generator._DEFAULT_TEXT[name])
+        if field_name is not None
+    ]
+
+    assert fields
+    assert all(field_name.isidentifier() and not spec and conversion is None for field_name, spec, conversion in fields)
+
+
+def test_today_refreshes_after_midnight(monkeypatch) -> None:
+    today = code_generator._today()
+    monkeypatch.setattr(code_generator, "_TODAY", "2000-01-01")
+    monkeypatch.setattr(code_generator, "_TODAY_EXPIRES", 0.0)
+
+    assert code_generator._today() == today
+
+
+def test_unwritable_templates_dir_uses_bundled_defaults(tmp_path, monkeypatch) -> None:
+    templates_dir = tmp_path / "templates"
+    real_mkdir = code_generator.Path.mkdir
+
+    def mkdir(self, *args, **kwargs):
+        if self == templates_dir or templates_dir in self.parents:
+            raise PermissionError(13, "Permission denied", str(self))
+        return real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(code_generator.Path, "mkdir", mkdir)
+    generator = CodeGenerator(str(templates_dir))
+    generator.create_python_class("Widget", output_dir=str(tmp_path / "out"))
+
+    assert "class Widget:" in (tmp_path / "out" / "widget.py").read_text(encoding="utf-8")
+    assert not templates_dir.exists()